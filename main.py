@@ -1,27 +1,89 @@
 import os
-from fastapi import FastAPI, HTTPException, Query
+import asyncio
+import base64
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
 from datetime import date
 from dotenv import load_dotenv
+from cachetools import TTLCache
 
 # Load env vars
 load_dotenv()
 MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
 DATABASE = os.getenv("DATABASE", "assessment_db")
-
-# Init FastAPI
-app = FastAPI(title="Employee Management API")
+AVG_SALARY_CACHE_TTL = int(os.getenv("AVG_SALARY_CACHE_TTL", "60"))
+# Number of uvicorn worker processes; each one opens its own connection pool
+WORKERS = max(1, int(os.getenv("WORKERS", "1")))
+ANALYTICS_READ_PREFERENCE = os.getenv("MONGODB_ANALYTICS_READ_PREFERENCE", "secondaryPreferred")
 
 # MongoDB connection
-client = AsyncIOMotorClient(MONGODB_URI)
+# Pool defaults are a per-host budget split across workers
+client = AsyncIOMotorClient(
+    MONGODB_URI,
+    maxPoolSize=int(os.getenv("MONGODB_MAX_POOL_SIZE", max(10, 200 // WORKERS))),
+    minPoolSize=int(os.getenv("MONGODB_MIN_POOL_SIZE", 20 // WORKERS)),
+    compressors="zstd,zlib",
+    retryReads=True,
+)
 db = client[DATABASE]
+# Point reads and writes stay on the primary so clients read their own writes
 collection = db["employees"]
+# Skill search tolerates replication lag and can be served by secondaries
+try:
+    analytics_read_preference = make_read_preference(read_pref_mode_from_name(ANALYTICS_READ_PREFERENCE), None)
+except ValueError:
+    raise ValueError(
+        f"Invalid MONGODB_ANALYTICS_READ_PREFERENCE {ANALYTICS_READ_PREFERENCE!r}; expected one of "
+        "primary, primaryPreferred, secondary, secondaryPreferred, nearest"
+    ) from None
+analytics_collection = collection.with_options(read_preference=analytics_read_preference)
+
+# Fields returned to clients, projected server-side so documents go straight to the response
+EMPLOYEE_PROJECTION = {
+    "_id": 0,
+    "employee_id": 1,
+    "name": 1,
+    "department": 1,
+    "salary": 1,
+    "joining_date": 1,
+    "skills": 1,
+}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await collection.create_indexes([
+        IndexModel([("employee_id", ASCENDING)], unique=True),
+        # list_employees: filter by department, newest joiners first. The department
+        # prefix also serves plain department equality matches.
+        IndexModel([
+            ("department", ASCENDING),
+            ("joining_date", DESCENDING),
+            ("employee_id", ASCENDING),
+        ]),
+        # list_employees without a department filter, including keyset pages
+        IndexModel([("joining_date", DESCENDING), ("employee_id", ASCENDING)]),
+        # search_employees: multikey index on the skills array
+        IndexModel([("skills", ASCENDING)]),
+    ])
+    # Warm up the connection pool before serving traffic
+    await collection.estimated_document_count()
+    yield
+
+# Init FastAPI
+app = FastAPI(title="Employee Management API", default_response_class=ORJSONResponse, lifespan=lifespan)
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 
 # ---------- MODELS ----------
 class Employee(BaseModel):
-    employee_id: str = Field(..., example="E123")
+    employee_id: str = Field(..., examples=["E123"])
     name: str
     department: str
     salary: float
@@ -29,63 +91,137 @@ class Employee(BaseModel):
     skills: List[str]
 
 class UpdateEmployee(BaseModel):
-    name: Optional[str]
-    department: Optional[str]
-    salary: Optional[float]
-    joining_date: Optional[date]
-    skills: Optional[List[str]]
+    name: Optional[str] = None
+    department: Optional[str] = None
+    salary: Optional[float] = None
+    joining_date: Optional[date] = None
+    skills: Optional[List[str]] = None
+
+# ---------- PAGINATION ----------
+# joining_date is stored as an ISO "YYYY-MM-DD" string, so cursors carry and compare it as one
+def encode_cursor(employee: dict) -> str:
+    token = f"{employee['joining_date']}|{employee['employee_id']}"
+    return base64.urlsafe_b64encode(token.encode()).decode()
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        joining_date, employee_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        if date.fromisoformat(joining_date).isoformat() == joining_date:
+            return joining_date, employee_id
+    except ValueError:
+        pass
+    raise HTTPException(status_code=400, detail="Invalid cursor")
 
 # ---------- QUERYING ----------
+AVG_SALARY_PIPELINE = [
+    {"$group": {"_id": "$department", "avg_salary": {"$avg": "$salary"}}},
+    {"$project": {"department": "$_id", "avg_salary": 1, "_id": 0}}
+]
+
+# Per-process cache of the avg-salary aggregation, invalidated on writes that change it.
+# Writes bump the generation so an aggregation that started before them is never cached.
+_avg_salary_cache = TTLCache(maxsize=1, ttl=AVG_SALARY_CACHE_TTL)
+_avg_salary_lock = asyncio.Lock()
+_avg_salary_generation = 0
+
+def invalidate_avg_salary():
+    global _avg_salary_generation
+    _avg_salary_generation += 1
+    _avg_salary_cache.clear()
+
 @app.get("/employees/avg-salary")
 async def avg_salary():
-    pipeline = [
-        {"$group": {"_id": "$department", "avg_salary": {"$avg": "$salary"}}},
-        {"$project": {"department": "$_id", "avg_salary": 1, "_id": 0}}
-    ]
-    result = await collection.aggregate(pipeline).to_list(length=None)
-    return result if result else []
+    if "result" in _avg_salary_cache:
+        return _avg_salary_cache["result"]
+    async with _avg_salary_lock:
+        if "result" in _avg_salary_cache:
+            return _avg_salary_cache["result"]
+        generation = _avg_salary_generation
+        # Read from the primary: a lagging secondary would cache pre-write averages for the full TTL
+        result = await collection.aggregate(AVG_SALARY_PIPELINE).to_list(length=None)
+        result = result if result else []
+        if generation == _avg_salary_generation:
+            _avg_salary_cache["result"] = result
+        return result
 
 @app.get("/employees/search")
 async def search_employees(skill: str):
-    cursor = collection.find({"skills": skill}, {"_id": 0})
+    cursor = analytics_collection.find({"skills": skill}, EMPLOYEE_PROJECTION).hint("skills_1")
     employees = await cursor.to_list(length=None)
     return employees
 
 @app.get("/employees")
 async def list_employees(
+    response: Response,
     department: Optional[str] = None,
+    after: Optional[str] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, le=50)
 ):
     query = {}
     if department:
         query["department"] = department
+    if after:
+        # Keyset pagination: resume right after the last employee of the previous page
+        joining_date, employee_id = decode_cursor(after)
+        query["$or"] = [
+            {"joining_date": {"$lt": joining_date}},
+            {"joining_date": joining_date, "employee_id": {"$gt": employee_id}},
+        ]
+        skip = 0
     cursor = (
-        collection.find(query, {"_id": 0})
-        .sort("joining_date", -1)
+        collection.find(query, EMPLOYEE_PROJECTION)
+        .sort([("joining_date", -1), ("employee_id", 1)])
         .skip(skip)
         .limit(limit)
     )
     employees = await cursor.to_list(length=limit)
+    if employees and len(employees) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(employees[-1])
     return employees
 
 # ---------- CRUD ----------
 @app.post("/employees")
 async def create_employee(employee: Employee):
-    existing = await collection.find_one({"employee_id": employee.employee_id})
-    if existing:
+    try:
+        await collection.insert_one(employee.model_dump(mode="json"))
+    except DuplicateKeyError:
         raise HTTPException(status_code=400, detail="Employee ID already exists")
-    await collection.insert_one(employee.dict())
+    invalidate_avg_salary()
     return {"message": "Employee created successfully"}
 
+@app.post("/employees/bulk")
+async def create_employees_bulk(employees: List[Employee]):
+    if not employees:
+        raise HTTPException(status_code=400, detail="No employees to create")
+    docs = [employee.model_dump(mode="json") for employee in employees]
+    try:
+        # Unordered so one duplicate doesn't stop the remaining inserts
+        result = await collection.insert_many(docs, ordered=False)
+        inserted, duplicates = len(result.inserted_ids), []
+    except BulkWriteError as bwe:
+        errors = bwe.details["writeErrors"]
+        inserted = bwe.details["nInserted"]
+        if bwe.details.get("writeConcernErrors") or any(error["code"] != 11000 for error in errors):
+            # Unordered inserts may still have written rows before failing
+            if inserted:
+                invalidate_avg_salary()
+            raise
+        duplicates = [error["op"]["employee_id"] for error in errors]
+    if inserted:
+        invalidate_avg_salary()
+    return {"inserted": inserted, "duplicates": duplicates}
+
 @app.put("/employees/{employee_id}")
 async def update_employee(employee_id: str, updates: UpdateEmployee):
-    update_data = {k: v for k, v in updates.dict().items() if v is not None}
+    update_data = {k: v for k, v in updates.model_dump(mode="json", exclude_unset=True).items() if v is not None}
     if not update_data:
         raise HTTPException(status_code=400, detail="No fields to update")
     result = await collection.update_one({"employee_id": employee_id}, {"$set": update_data})
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Employee not found")
+    if "salary" in update_data or "department" in update_data:
+        invalidate_avg_salary()
     return {"message": "Employee updated successfully"}
 
 @app.delete("/employees/{employee_id}")
@@ -93,11 +229,28 @@ async def delete_employee(employee_id: str):
     result = await collection.delete_one({"employee_id": employee_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Employee not found")
+    invalidate_avg_salary()
     return {"message": "Employee deleted successfully"}
 
 @app.get("/employees/{employee_id}")
 async def get_employee(employee_id: str):
-    employee = await collection.find_one({"employee_id": employee_id}, {"_id": 0})
+    employee = await collection.find_one({"employee_id": employee_id}, EMPLOYEE_PROJECTION)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     return employee
+
+# ---------- ENTRYPOINT ----------
+if __name__ == "__main__":
+    import uvicorn
+
+    # Exported so each worker process sizes its connection pool for the whole fleet
+    workers = max(1, int(os.getenv("WORKERS", os.cpu_count() or 1)))
+    os.environ["WORKERS"] = str(workers)
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+    )
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from mongomock_motor import AsyncMongoMockClient
+
+import main
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = AsyncMongoMockClient()["test_db"]["employees"]
+    asyncio.run(collection.create_index("employee_id", unique=True))
+    asyncio.run(collection.create_index("skills"))
+    monkeypatch.setattr(main, "collection", collection)
+    monkeypatch.setattr(main, "analytics_collection", collection)
+    main._avg_salary_cache.clear()
+    return collection
+
+
+@pytest.fixture
+def client(collection):
+    # Not used as a context manager, so the lifespan handler never talks to a real server
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def seed(collection):
+    def insert(*employees):
+        asyncio.run(collection.insert_many(list(employees)))
+    return insert
+
+
+@pytest.fixture
+def make_employee():
+    def build(employee_id, joining_date, department="Engineering", salary=80000):
+        # joining_date is stored as an ISO string, as written by create_employee
+        return {
+            "employee_id": employee_id,
+            "name": f"Employee {employee_id}",
+            "department": department,
+            "salary": salary,
+            "joining_date": joining_date,
+            "skills": ["Python"],
+        }
+    return build
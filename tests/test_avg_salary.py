@@ -0,0 +1,35 @@
+import main
+
+
+def test_avg_salary_is_cached_until_a_write(client, seed, make_employee):
+    seed(make_employee("E101", "2024-12-01", salary=80000))
+    assert client.get("/employees/avg-salary").json() == [{"department": "Engineering", "avg_salary": 80000}]
+
+    seed(make_employee("E102", "2025-06-15", salary=100000))
+    # Inserted behind the API's back, so the cached result is still served
+    assert client.get("/employees/avg-salary").json() == [{"department": "Engineering", "avg_salary": 80000}]
+
+    assert client.put("/employees/E102", json={"salary": 120000}).status_code == 200
+    assert client.get("/employees/avg-salary").json() == [{"department": "Engineering", "avg_salary": 100000}]
+
+
+def test_write_during_aggregation_is_not_lost(client, collection, seed, monkeypatch, make_employee):
+    seed(make_employee("E101", "2024-12-01", salary=80000))
+    aggregate = collection.aggregate
+
+    def aggregate_with_concurrent_write(pipeline):
+        cursor = aggregate(pipeline)
+        to_list = cursor.to_list
+
+        async def to_list_then_write(length=None):
+            result = await to_list(length=length)
+            # A write lands after the aggregation read but before its result is cached
+            main.invalidate_avg_salary()
+            return result
+
+        cursor.to_list = to_list_then_write
+        return cursor
+
+    monkeypatch.setattr(collection, "aggregate", aggregate_with_concurrent_write)
+    assert client.get("/employees/avg-salary").status_code == 200
+    assert "result" not in main._avg_salary_cache
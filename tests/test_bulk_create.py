@@ -0,0 +1,78 @@
+import pytest
+from pymongo.errors import BulkWriteError
+
+import main
+
+
+def test_bulk_create_inserts_all_employees(client, make_employee):
+    response = client.post("/employees/bulk", json=[
+        make_employee("E101", "2024-12-01"),
+        make_employee("E102", "2025-06-15"),
+    ])
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 2, "duplicates": []}
+    # joining_date is stored in the same ISO form the single-employee endpoint uses
+    assert client.get("/employees/E102").json()["joining_date"] == "2025-06-15"
+
+
+def test_bulk_create_reports_duplicates_and_inserts_the_rest(client, seed, make_employee):
+    seed(make_employee("E101", "2024-12-01"))
+    response = client.post("/employees/bulk", json=[
+        make_employee("E101", "2024-12-01"),
+        make_employee("E102", "2025-06-15"),
+        make_employee("E102", "2025-06-15"),
+        make_employee("E103", "2023-03-10"),
+    ])
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 2, "duplicates": ["E101", "E102"]}
+    assert client.get("/employees/E103").status_code == 200
+
+
+def test_bulk_create_rejects_empty_batch(client):
+    response = client.post("/employees/bulk", json=[])
+    assert response.status_code == 400
+
+
+def raise_bulk_write_error(monkeypatch, collection, details):
+    async def insert_many(docs, ordered=True):
+        raise BulkWriteError({
+            "writeErrors": [],
+            "writeConcernErrors": [],
+            "nInserted": 0,
+            **details,
+        })
+
+    monkeypatch.setattr(collection, "insert_many", insert_many)
+
+
+def test_bulk_create_fails_on_other_write_errors_and_invalidates_averages(
+    client, collection, seed, make_employee, monkeypatch
+):
+    seed(make_employee("E101", "2024-12-01"))
+    assert client.get("/employees/avg-salary").status_code == 200
+    assert "result" in main._avg_salary_cache
+
+    raise_bulk_write_error(monkeypatch, collection, {
+        "nInserted": 1,
+        "writeErrors": [
+            {"index": 0, "code": 11000, "errmsg": "duplicate key", "op": make_employee("E101", "2024-12-01")},
+            {"index": 2, "code": 121, "errmsg": "Document failed validation", "op": make_employee("E103", "2023-03-10")},
+        ],
+    })
+    with pytest.raises(BulkWriteError):
+        client.post("/employees/bulk", json=[
+            make_employee("E101", "2024-12-01"),
+            make_employee("E102", "2025-06-15"),
+            make_employee("E103", "2023-03-10"),
+        ])
+    # E102 was written before the failure, so cached averages must not survive
+    assert "result" not in main._avg_salary_cache
+
+
+def test_bulk_create_fails_on_write_concern_errors(client, collection, make_employee, monkeypatch):
+    raise_bulk_write_error(monkeypatch, collection, {
+        "nInserted": 1,
+        "writeConcernErrors": [{"code": 64, "errmsg": "waiting for replication timed out"}],
+    })
+    with pytest.raises(BulkWriteError):
+        client.post("/employees/bulk", json=[make_employee("E101", "2024-12-01")])
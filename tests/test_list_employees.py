@@ -0,0 +1,75 @@
+import base64
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def employees(seed, make_employee):
+    seed(
+        make_employee("E101", "2024-12-01"),
+        make_employee("E102", "2025-06-15"),
+        make_employee("E103", "2025-06-15"),
+        make_employee("E104", "2023-03-10"),
+        make_employee("E201", "2025-01-01", department="Sales"),
+    )
+
+
+def list_ids(response):
+    return [employee["employee_id"] for employee in response.json()]
+
+
+def test_cursor_round_trip_over_full_pages(client):
+    params = {"department": "Engineering", "limit": 2}
+
+    first = client.get("/employees", params=params)
+    assert first.status_code == 200
+    assert list_ids(first) == ["E102", "E103"]
+
+    second = client.get("/employees", params={**params, "after": first.headers["X-Next-Cursor"]})
+    assert second.status_code == 200
+    assert list_ids(second) == ["E101", "E104"]
+
+    third = client.get("/employees", params={**params, "after": second.headers["X-Next-Cursor"]})
+    assert third.status_code == 200
+    assert third.json() == []
+    assert "X-Next-Cursor" not in third.headers
+
+
+def test_partial_page_has_no_next_cursor(client):
+    response = client.get("/employees", params={"department": "Sales", "limit": 2})
+    assert list_ids(response) == ["E201"]
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_limit_zero_returns_empty_list(client, collection, monkeypatch):
+    # Motor's to_list(length=0) returns no documents; mongomock returns them all
+    find = collection.find
+
+    def motor_find(*args, **kwargs):
+        cursor = find(*args, **kwargs)
+        to_list = cursor.to_list
+
+        async def motor_to_list(length=None):
+            return [] if length == 0 else await to_list(length=length)
+
+        cursor.to_list = motor_to_list
+        return cursor
+
+    monkeypatch.setattr(collection, "find", motor_find)
+    response = client.get("/employees", params={"limit": 0})
+    assert response.status_code == 200
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    base64.urlsafe_b64encode(b"2025-06-15").decode(),
+    base64.urlsafe_b64encode(b"not-a-date|E102").decode(),
+    base64.urlsafe_b64encode(b"20250615|E102").decode(),
+    base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+])
+def test_invalid_cursor_is_rejected(client, cursor):
+    response = client.get("/employees", params={"after": cursor})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}